@@ -4,7 +4,6 @@ import numpy as np
 import shutil
 import tempfile
 import mimetypes
-import subprocess
 from datetime import datetime, timedelta
 
 from astropy.io import fits as astrofits
@@ -88,26 +87,48 @@ def get_image(log_dir: str, date: Optional[str]=None) -> Optional[str]:
     return latest_image
 
 
-@timed_lru_cache(seconds=300)
+# Cache of loaded images keyed by filename, validated against the file's
+# st_mtime_ns so a changed file invalidates naturally
+_IMAGE_CACHE = {}
+_IMAGE_CACHE_MAX = 16
+
+
 def get_image_data(filename: str) -> Dict[str,Any]:
     """
     Given a filename that points to an image, load the image and return a
-    dictionary containing the image content type and data.  Returns and empty
-    dictionary if the file doesn't exist.
+    dictionary containing the image content type and data.  Repeat requests
+    for an unchanged file are served from an in-memory cache at the cost of a
+    single stat call.  Returns and empty dictionary if the file doesn't exist.
     """
-    
+
     data = {}
-    if os.path.exists(filename):
-        try:
-            ct, en = mimetypes.guess_file_type(filename)
-        except AttributeError:
-            ct, en = mimetypes.guess_type(filename)
-        data['content-type'] = ct
-        data['content-encoding'] = en
-        data['last-modified'] = timestamp_to_rfc2822(os.path.getmtime(filename))
-        with open(filename, 'rb') as fh:
-            data['data'] = fh.read()
-            
+    try:
+        st = os.stat(filename)
+    except OSError:
+        return data
+
+    try:
+        mtime_ns, data = _IMAGE_CACHE[filename]
+        if mtime_ns == st.st_mtime_ns:
+            return data
+    except KeyError:
+        pass
+
+    data = {}
+    try:
+        ct, en = mimetypes.guess_file_type(filename)
+    except AttributeError:
+        ct, en = mimetypes.guess_type(filename)
+    data['content-type'] = ct
+    data['content-encoding'] = en
+    data['last-modified'] = timestamp_to_rfc2822(st.st_mtime)
+    with open(filename, 'rb') as fh:
+        data['data'] = fh.read()
+
+    while len(_IMAGE_CACHE) >= _IMAGE_CACHE_MAX:
+        _IMAGE_CACHE.pop(next(iter(_IMAGE_CACHE)))
+    _IMAGE_CACHE[filename] = (st.st_mtime_ns, data)
+
     return data
 
 
@@ -165,6 +186,9 @@ def fits_to_movie(filename: str, persist: bool=False, tstart: Optional[str]=None
               and a duration in seconds to convert.
     """
     
+    # Deferred import - only the movie path shells out to ffmpeg
+    import subprocess
+
     mp4name = None
     if os.path.exists(filename):
         tempdir = tempfile.mkdtemp()
@@ -113,9 +113,9 @@ def parse_log_line(line: str, data: Optional[Dict[str,Any]]=None) -> Dict[str, A
                     data['end_of_day'] = True
                     _CAPTURE_STARTED = False
                 else:
-                    _, nsdt = message.split(':', 1)
+                    _, _, nsdt = message.partition(':')
                     nsdt = nsdt.strip()
-                    nsdt, _ = nsdt.rsplit('.', 1)
+                    nsdt, _, _ = nsdt.rpartition('.')
                     nsdt = nsdt.replace(' ', 'T')
                     nsdt += 'Z'
                     nsdt = nsdt.replace('/', '-')
@@ -125,9 +125,9 @@ def parse_log_line(line: str, data: Optional[Dict[str,Any]]=None) -> Dict[str, A
                     
         elif mod == 'EventMonitor':
             if message.startswith('Next Capture start'):
-                _, nst= message.split(':', 1)
+                _, _, nst = message.partition(':')
                 nst = nst.strip()
-                nst, _ = nst.split(' UTC', 1)
+                nst, _, _ = nst.partition(' UTC')
                 nsdt = f"{mtch.group('date')}T{nst}Z"
                 nsdt = nsdt.replace('/', '-')
                 
@@ -158,12 +158,12 @@ def parse_log_line(line: str, data: Optional[Dict[str,Any]]=None) -> Dict[str, A
                 
         elif mod == 'DetectStarsAndMeteors':
             if message.startswith('Detected stars:'):
-                _, nstar = message.split(':', 1)
+                _, _, nstar = message.partition(':')
                 nstar = int(nstar, 10)
                 data['detections']['n_star'] = nstar
                 data['detections']['updated'] = dt
             elif message.find('detected meteors:') != -1:
-                _, nmeteor = message.rsplit(':', 1)
+                _, _, nmeteor = message.rpartition(':')
                 nmeteor = int(nmeteor, 10)
                 try:
                     data['detections']['n_meteor'] += nmeteor
@@ -175,7 +175,7 @@ def parse_log_line(line: str, data: Optional[Dict[str,Any]]=None) -> Dict[str, A
                 
         elif mod == 'MLFilter':
             if message.startswith('FTPdetectinfo filtered,'):
-                nmeteor_final, _ = message.split('/', 1)
+                nmeteor_final, _, _ = message.partition('/')
                 _, nmeteor_final = nmeteor_final.rsplit(None, 1)
                 nmeteor_final = int(nmeteor_final, 10)
                 data['detections']['n_meteor_final'] = nmeteor_final
@@ -230,7 +230,7 @@ def parse_log_line(line: str, data: Optional[Dict[str,Any]]=None) -> Dict[str, A
                     except ValueError:
                         pass
             if param.startswith('camera_'):
-                _, param = param.split('_', 1)
+                _, _, param = param.partition('_')
                 data['camera'][param] = value
             elif param.startswith('jitter_quality'):
                 data['camera']['jitter_quality'] = value
@@ -1,23 +1,42 @@
 import os
 import re
-import copy
+import gzip
 import json
+import time
+import shutil
+import hashlib
+import mimetypes
+import weakref
 import threading
-from collections import deque
+import traceback
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from email.utils import formatdate
+from functools import lru_cache
 
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import thread as _futures_thread
 from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
 from socketserver import BaseRequestHandler
-from urllib.parse import unquote_plus
+from urllib.parse import urlsplit, parse_qsl
 
 from .static import get_asset, get_asset_data
-from .images import get_radiants, get_stack, get_image, get_image_data, fits_to_image, fits_to_movie
+from .images import get_radiants, get_stack, get_image, fits_to_image, fits_to_movie
 from .data import get_meteor_details, get_meteor_fits_file
 from .utils import timestamp_to_iso, iso_to_timestamp, timestamp_to_rfc2822, get_archive_dir
 from .system import *
 
 from typing import Optional, Dict, Any, List, Callable
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return bytes(json.dumps(obj), "utf-8")
+
 
 __all__ = ['TelemetryServer', 'TelemetryHandler']
 
@@ -26,6 +45,92 @@ __all__ = ['TelemetryServer', 'TelemetryHandler']
 _DUMMY_TIME = timestamp_to_iso(0)
 
 
+# Reset templates applied at the end-of-day rollover when a capture is not
+# running
+_IDLE_CAPTURE = {'duration_hr': 0.0,
+                 'started': _DUMMY_TIME,
+                 'latest_block': _DUMMY_TIME,
+                 'block_max_age_s': 0.0,
+                 'n_frames_dropped': 0,
+                 'latest_all_white': _DUMMY_TIME}
+_IDLE_DETECTIONS = {'n_meteor': 0,
+                    'last_meteor': _DUMMY_TIME,
+                    'n_meteor_final': 0}
+
+
+# Sections that carry an 'updated' time in the main and system data
+# structures
+_UPDATED_KEYS = ('capture', 'detections', 'camera', 'upload')
+_SYSTEM_KEYS = ('system', 'memory', 'network', 'disk')
+
+
+# Compression level for the pre-compressed JSON payloads - level 3 is several
+# times faster than the default with nearly the same ratio on JSON
+_GZIP_LEVEL = 3
+
+
+def _most_recently_updated(data_obj: Dict[str,Any], keys: tuple=_UPDATED_KEYS) -> str:
+    """
+    Find the most recent 'updated' ISO8601 time across the sections of a data
+    structure.  ISO8601 strings sort lexicographically so this is a plain
+    string comparison with no intermediate list.
+    """
+
+    updated = _DUMMY_TIME
+    for key in keys:
+        sub = data_obj.get(key)
+        if sub is not None:
+            u = sub.get('updated')
+            if u is not None and u > updated:
+                updated = u
+    return updated
+
+
+@lru_cache(maxsize=32)
+def _iso_to_rfc2822(iso: str) -> str:
+    """
+    Convert an ISO8601 time into a RFC2822 time, caching the result.  The
+    'updated' field often holds the same value across consecutive pushes, in
+    which case this skips the parse-and-reformat round trip entirely.
+    """
+
+    return timestamp_to_rfc2822(iso_to_timestamp(iso))
+
+
+class _DaemonThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    ThreadPoolExecutor whose workers are daemon threads that skip the
+    concurrent.futures interpreter-exit hook.  A worker can sit blocked
+    reading an idle keep-alive connection, and the default non-daemon
+    workers would keep the process alive after server_close until every
+    such client hung up.
+    """
+
+    def _adjust_thread_count(self):
+        # Mirrors ThreadPoolExecutor._adjust_thread_count but starts the
+        # worker as a daemon thread and leaves it out of _threads_queues so
+        # it is neither joined at interpreter exit nor able to block it
+        if self._idle_semaphore.acquire(timeout=0):
+            return
+
+        def weakref_cb(_, q=self._work_queue):
+            q.put(None)
+
+        num_threads = len(self._threads)
+        if num_threads < self._max_workers:
+            thread_name = '%s_%d' % (self._thread_name_prefix or self,
+                                     num_threads)
+            t = threading.Thread(name=thread_name,
+                                 target=_futures_thread._worker,
+                                 args=(weakref.ref(self, weakref_cb),
+                                       self._work_queue,
+                                       self._initializer,
+                                       self._initargs),
+                                 daemon=True)
+            t.start()
+            self._threads.add(t)
+
+
 class TelemetryServer(ThreadingHTTPServer):
     """
     HTTP server for telemetry data that handles not only the requests but also
@@ -43,13 +148,20 @@ class TelemetryServer(ThreadingHTTPServer):
         self._log_dir = log_dir
         self._max_history = max_history
         self._data = {}
+        self._data_json = b'{}'
+        self._data_gzip = gzip.compress(self._data_json, _GZIP_LEVEL)
+        self._data_etag = _etag_for(self._data_json)
         self._last_modified = _DUMMY_TIME
-        self._previous_data = deque([], self._max_history)
+        self._previous_data = OrderedDict()
         self._previous_last_modified = _DUMMY_TIME
         self._system_data = {}
+        self._system_json = b'{}'
+        self._system_gzip = gzip.compress(self._system_json, _GZIP_LEVEL)
         self._system_last_modified = _DUMMY_TIME
-        self._lock = threading.RLock()
-        
+        self._lock = threading.Lock()
+        self._pool = _DaemonThreadPoolExecutor(max_workers=16,
+                                               thread_name_prefix='rms-http')
+
     @property
     def ip(self):
         """
@@ -82,6 +194,14 @@ class TelemetryServer(ThreadingHTTPServer):
         
         return self._last_modified
         
+    @property
+    def data_etag(self):
+        """
+        Return the ETag of the encoded main data structure.
+        """
+
+        return self._data_etag
+
     @property
     def previous_last_modified(self):
         """
@@ -106,25 +226,37 @@ class TelemetryServer(ThreadingHTTPServer):
         with self._lock:
             if 'end_of_day' in data_obj:
                 if data_obj['end_of_day']:
-                    self._previous_data.append(copy.deepcopy(self._data))
                     try:
-                        updated = max([self._data[key]['updated'] for key in ('capture', 'detections', 'camera', 'upload') if key in self._data and 'updated' in self._data[key]])
-                    except ValueError:
-                        updated = _DUMMY_TIME
-                    updated = iso_to_timestamp(updated)
-                    self._previous_last_modified = timestamp_to_rfc2822(updated)
+                        started = self._data['capture']['started']
+                    except KeyError:
+                        started = _DUMMY_TIME
+                    date, _, _ = started.partition('T')
+                    date = date.replace('-', '')
+                    try:
+                        n_meteor_final = self._data['detections']['n_meteor_final']
+                    except KeyError:
+                        n_meteor_final = 0
+                    # Archive the pre-serialized payload plus the few fields
+                    # that /previous/details needs - no deepcopy and JSON
+                    # bytes are far smaller than the live dict graph.  The
+                    # copy-on-write update means lock-free readers never see
+                    # the history mid-update.
+                    previous_data = self._previous_data.copy()
+                    previous_data[date] = {'started': started,
+                                           'station_id': self._data.get('station_id'),
+                                           'n_meteor_final': n_meteor_final,
+                                           'payload': self._data_json,
+                                           'gzip-payload': self._data_gzip}
+                    while len(previous_data) > self._max_history:
+                        previous_data.popitem(last=False)
+                    self._previous_data = previous_data
+                    updated = _most_recently_updated(self._data)
+                    self._previous_last_modified = _iso_to_rfc2822(updated)
                     del data_obj['end_of_day']
                     
                     if not data_obj['capture']['running']:
-                        data_obj['capture']['duration_hr'] = 0.0
-                        data_obj['capture']['started'] = _DUMMY_TIME
-                        data_obj['capture']['latest_block'] = _DUMMY_TIME
-                        data_obj['capture']['block_max_age_s'] = 0.0
-                        data_obj['capture']['n_frames_dropped'] = 0
-                        data_obj['capture']['latest_all_white'] = _DUMMY_TIME
-                        data_obj['detections']['n_meteor'] = 0
-                        data_obj['detections']['last_meteor'] = _DUMMY_TIME
-                        data_obj['detections']['n_meteor_final'] = 0
+                        data_obj['capture'].update(_IDLE_CAPTURE)
+                        data_obj['detections'].update(_IDLE_DETECTIONS)
                         data_obj['upload']['attempted'] = []
                         data_obj['upload']['completed'] = []
                         
@@ -133,37 +265,41 @@ class TelemetryServer(ThreadingHTTPServer):
                             del data_obj[llevel]
                             
             self._data = data_obj
-            try:
-                updated = max([data_obj[key]['updated'] for key in ('capture', 'detections', 'camera', 'upload') if key in data_obj and 'updated' in data_obj[key]])
-            except ValueError:
-                updated = _DUMMY_TIME
-            updated = iso_to_timestamp(updated)
-            self._last_modified = timestamp_to_rfc2822(updated)
+            self._data_json = _dumps(data_obj)
+            self._data_gzip = gzip.compress(self._data_json, _GZIP_LEVEL)
+            self._data_etag = _etag_for(self._data_json)
+            updated = _most_recently_updated(data_obj)
+            self._last_modified = _iso_to_rfc2822(updated)
             
     def get_data(self) -> Dict[str,Any]:
         """
         Return the most recent state.
+
+        .. note:: This is a reference to the live state, not a copy.  Request
+                  handlers must treat it as read-only; the log-parsing loop is
+                  the only caller that may update it, and it hands the result
+                  back through set_data.
         """
-        
-        with self._lock:
-            return copy.deepcopy(self._data)
-            
+
+        return self._data
+
+    def get_data_json(self, gzipped: bool=False) -> bytes:
+        """
+        Return the most recent state pre-encoded as JSON.  The encoded form is
+        rebuilt inside set_data, so requests never pay for `json.dumps`.
+        Setting `gzipped` to True returns the pre-compressed variant instead.
+        """
+
+        if gzipped:
+            return self._data_gzip
+        return self._data_json
+
     def get_previous_dates(self) -> List[str]:
         """
         Return a list of YYYYMMDD dates in the history.
         """
-        
-        with self._lock:
-            dates = []
-            for entry in self._previous_data:
-                if 'capture' not in entry:
-                    continue
-                if 'started' not in entry['capture']:
-                    continue
-                date, _ = entry['capture']['started'].split('T', 1)
-                dates.append(date.replace('-', ''))
-                
-        return dates
+
+        return list(self._previous_data)
         
     def get_previous_data(self, date: Optional[str]=None) -> Optional[Dict[str,Any]]:
         """
@@ -171,45 +307,188 @@ class TelemetryServer(ThreadingHTTPServer):
         most recent entry is returned.  Otherwise, `data` is used to find the
         YYYYMMDD entry.  If there is no history or the specified date cannot be
         found None is returned.
+
+        Each entry is a small dict of 'started', 'station_id', and
+        'n_meteor_final' plus the full day's state pre-serialized as JSON
+        under 'payload'.
         """
         
-        with self._lock:
-            if self._previous_data:
-                if date is None:
-                    return self._previous_data[-1]
-                else:
-                    for entry in self._previous_data:
-                        if 'capture' in entry and 'started' in entry['capture']:
-                            if entry['capture']['started'].replace('-', '').startswith(date):
-                                return entry
+        previous_data = self._previous_data
+        if previous_data:
+            if date is None:
+                return next(reversed(previous_data.values()))
+            else:
+                return previous_data.get(date)
         return None
         
     def set_system_data(self, data_obj: Dict[str,Any]):
         with self._lock:
             self._system_data = data_obj
-            try:
-                updated = max([data_obj[key]['updated'] for key in ('system', 'memory', 'network', 'disk') if key in data_obj and 'updated' in data_obj[key]])
-            except ValueError:
-                updated = _DUMMY_TIME
-            updated = iso_to_timestamp(updated)
-            self._system_last_modified = timestamp_to_rfc2822(updated)
+            self._system_json = _dumps(data_obj)
+            self._system_gzip = gzip.compress(self._system_json, _GZIP_LEVEL)
+            updated = _most_recently_updated(data_obj, keys=_SYSTEM_KEYS)
+            self._system_last_modified = _iso_to_rfc2822(updated)
             
     def get_system_data(self) -> Dict[str,Any]:
-        with self._lock:
-            return copy.deepcopy(self._system_data)
-        
+        """
+        Return the most recent system state.
+
+        .. note:: This is a reference to the live state, not a copy, and must
+                  be treated as read-only.  The monitoring loop publishes a
+                  freshly built dict through set_system_data each cycle, so
+                  readers never see one mid-update.
+        """
+
+        return self._system_data
+
+    def get_system_data_json(self, gzipped: bool=False) -> bytes:
+        """
+        Return the most recent system state pre-encoded as JSON.  The encoded
+        form is rebuilt inside set_system_data, so requests never pay for
+        `json.dumps`.  Setting `gzipped` to True returns the pre-compressed
+        variant instead.
+        """
+
+        if gzipped:
+            return self._system_gzip
+        return self._system_json
+
+    def process_request(self, request, client_address):
+        """
+        Hand the request off to the worker pool.  Using a bounded pool
+        instead of ThreadingHTTPServer's thread-per-connection keeps the
+        thread count fixed under bursty polling; excess connections simply
+        wait in the socket backlog.
+
+        .. note:: This only holds together with the handler's read timeout.
+                  A worker serves a keep-alive connection for as long as it
+                  stays open, so without the timeout a few idle clients
+                  would pin every worker and the backlog would never drain.
+        """
+
+        self._pool.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self):
+        super().server_close()
+        self._pool.shutdown(wait=False)
+
     def run(self):
         """
         Start the server thread.
         """
-        
+
         server_thread = threading.Thread(target=self.serve_forever)
         server_thread.daemon_threads = True
         server_thread.start()
 
 
-# RegEx to match a GET request
-_getRE = re.compile(r'GET (/.*?(\?.*)?) HTTP.+')
+# Fixed portion of the response preamble - everything up through the
+# Content-Type header is the same for every 200 response with a given type so
+# build it once and reuse it
+_SERVER_LINE = b'Server: RMS_telemetry/1.0\r\n'
+_PREAMBLE_CACHE = {}
+
+# Pre-encoded error preambles and bodies - these are constant so there is no
+# reason to re-encode them per request
+_404_PREAMBLE = b'HTTP/1.1 404 Not Found\r\n' + _SERVER_LINE \
+                + b'Content-Type: text/plain\r\n'
+_500_PREAMBLE = b'HTTP/1.1 500 Internal Server Error\r\n' + _SERVER_LINE \
+                + b'Content-Type: text/plain\r\n'
+_404_BODY = b'The requested URL was not found on this server.'
+_404_INACTIVE_BODY = b'The requested URL was not found on this server because a capture is not active.'
+_500_BODY = b'Internal Error - processing request'
+
+# Pre-encoded Cache-Control header lines for the cache policies in use
+_CACHE_CONTROL_30 = b'Cache-Control: max-age=30, must-revalidate\r\n'
+_CACHE_CONTROL_300 = b'Cache-Control: max-age=300, must-revalidate\r\n'
+_CACHE_CONTROL_600 = b'Cache-Control: max-age=600, must-revalidate\r\n'
+
+# Pre-encoded Vary header for responses negotiated on Accept-Encoding - an
+# intermediary cache must not hand gzip bytes to a client that didn't ask
+# for them
+_VARY_ACCEPT_ENCODING = b'Vary: Accept-Encoding\r\n'
+
+# Cached Date header at 1 s granularity since that is all the resolution the
+# header has anyway - [timestamp, formatted string, full header line]
+_DATE_CACHE = [0, '', b'']
+
+
+def _etag_for(payload: bytes) -> str:
+    """
+    Compute a strong ETag for a response payload.  BLAKE2b is the fastest
+    hash in hashlib and eight bytes of digest is plenty for revalidation.
+    """
+
+    return '"' + hashlib.blake2b(payload, digest_size=8).hexdigest() + '"'
+
+
+def _file_etag(st: os.stat_result) -> str:
+    """
+    Compute an ETag for a file from its stat result without touching the
+    contents.
+    """
+
+    return f'"{int(st.st_mtime)}-{st.st_size}"'
+
+
+# Request paths that are aliases for other paths
+_REWRITES = {'/': '/index.html',
+             '/favicon.ico': '/images/favicon.ico',
+             '/previous/details.html': '/details.html'}
+
+
+# What a query string value has to look like to be treated as an int or a
+# float
+_INT_RE = re.compile(r'[-+]?\d+$')
+_FLOAT_RE = re.compile(r'[-+]?(?:\d+\.\d*|\.?\d+)(?:[eE][-+]?\d+)?$')
+
+
+def _coerce(value: str) -> Any:
+    """
+    Convert a query string value into a bool, int, or float where possible.
+    Values that do not look like any of those come back unchanged.  The
+    checks are regex matches rather than try/except around int()/float()
+    since raising and catching a ValueError costs far more than a failed
+    match on the common already-a-string case.
+    """
+
+    lvalue = value.lower()
+    if lvalue == 'true':
+        return True
+    elif lvalue == 'false':
+        return False
+    elif _INT_RE.match(value):
+        return int(value, 10)
+    elif _FLOAT_RE.match(value):
+        return float(value)
+    return value
+
+
+def _date_string() -> str:
+    """
+    Return the current time formatted for a 'Date' header, cached at one
+    second granularity.
+    """
+
+    now = int(time.time())
+    if now != _DATE_CACHE[0]:
+        formatted = formatdate(now, usegmt=True)
+        _DATE_CACHE[0] = now
+        _DATE_CACHE[1] = formatted
+        _DATE_CACHE[2] = b'Date: ' + formatted.encode('ascii') + b'\r\n'
+    return _DATE_CACHE[1]
+
+
+def _date_header() -> bytes:
+    """
+    Return the current time as a 'Date: ...' header line, cached at one second
+    granularity.
+    """
+
+    now = int(time.time())
+    if now != _DATE_CACHE[0]:
+        _date_string()
+    return _DATE_CACHE[2]
 
 
 class URLNotFoundError(RuntimeError):
@@ -236,10 +515,13 @@ class HandlerRegistry:
         
     def __contains__(self, path: str) -> bool:
         return path in self._handlers
-        
+
     def __getitem__(self, path: str) -> Callable:
         return self._handlers[path]
 
+    def get(self, path: str, default: Optional[Callable]=None) -> Optional[Callable]:
+        return self._handlers.get(path, default)
+
 
 class  TelemetryHandler(BaseHTTPRequestHandler):
     """
@@ -247,86 +529,200 @@ class  TelemetryHandler(BaseHTTPRequestHandler):
     """
     
     _handlers = HandlerRegistry()
-    
+
+    # Persistent connections - every response carries a Content-Length (or is
+    # a bodyless 304) so clients can reuse the connection between polls.
+    # This is only safe alongside the bounded worker pool because of the
+    # read timeout below, which stops an idle connection from holding a
+    # worker between requests
+    protocol_version = 'HTTP/1.1'
+
+    # Set to True to log a traceback whenever a handler fails with a 500
+    debug = False
+
+    # Deadline in seconds for reads on a persistent connection.  Without it
+    # an idle keep-alive client pins its pool worker in rfile.readline()
+    # between requests and a handful of idlers can starve the whole pool.
+    # On expiry the base class turns the timeout into close_connection and
+    # the worker goes back to the pool.
+    timeout = 30
+
+    def date_time_string(self, timestamp: Optional[float]=None) -> str:
+        """
+        Return the current time formatted for a message header, reusing the
+        one-second Date cache so that responses sent through the base class
+        machinery (304s, errors) don't re-format the time from scratch.
+        """
+
+        if timestamp is not None:
+            return super().date_time_string(timestamp)
+        return _date_string()
+
+    def accepts_gzip(self) -> bool:
+        """
+        Return whether the client advertised gzip support via Accept-Encoding.
+        """
+
+        return self.headers.get('Accept-Encoding', '').find('gzip') != -1
+
+    def send_ok(self, body: bytes, content_type: str='application/json',
+                      content_encoding: Optional[str]=None,
+                      last_modified: Optional[str]=None,
+                      cache_control: Optional[bytes]=None,
+                      etag: Optional[str]=None,
+                      vary: Optional[bytes]=None):
+        """
+        Send a complete 200 response - status line, headers, and body - in a
+        single write.  Everything except the Date and Last-Modified headers is
+        pre-formatted so the per-request work is just concatenation.
+        """
+
+        try:
+            preamble = _PREAMBLE_CACHE[content_type]
+        except KeyError:
+            preamble = b'HTTP/1.1 200 OK\r\n' + _SERVER_LINE \
+                       + b'Content-Type: ' + content_type.encode('ascii') + b'\r\n'
+            _PREAMBLE_CACHE[content_type] = preamble
+
+        headers = preamble + _date_header()
+        if content_encoding is not None:
+            headers += b'Content-Encoding: ' + content_encoding.encode('ascii') + b'\r\n'
+        if last_modified is not None:
+            headers += b'Last-Modified: ' + last_modified.encode('ascii') + b'\r\n'
+        if etag is not None:
+            headers += b'ETag: ' + etag.encode('ascii') + b'\r\n'
+        if cache_control is not None:
+            headers += cache_control
+        if vary is not None:
+            headers += vary
+        headers += b'Content-Length: ' + str(len(body)).encode('ascii') + b'\r\n\r\n'
+
+        self.wfile.write(headers + body)
+        self.log_request(200)
+
+    def send_plain_error(self, status: int, preamble: bytes, body: bytes):
+        """
+        Send a complete error response from pre-encoded parts in a single
+        write.
+        """
+
+        headers = preamble + _date_header() \
+                  + b'Content-Length: ' + str(len(body)).encode('ascii') + b'\r\n\r\n'
+        self.wfile.write(headers + body)
+        self.log_request(status)
+
+    def send_not_modified(self, last_modified: str,
+                                cache_control: Optional[bytes]=None,
+                                etag: Optional[str]=None,
+                                vary: Optional[bytes]=None):
+        """
+        Send a complete 304 response in a single write.
+        """
+
+        headers = b'HTTP/1.1 304 Not Modified\r\n' + _SERVER_LINE + _date_header() \
+                  + b'Last-Modified: ' + last_modified.encode('ascii') + b'\r\n'
+        if etag is not None:
+            headers += b'ETag: ' + etag.encode('ascii') + b'\r\n'
+        if cache_control is not None:
+            headers += cache_control
+        if vary is not None:
+            headers += vary
+        headers += b'\r\n'
+
+        self.wfile.write(headers)
+        self.log_request(304)
+
+    def send_file_ok(self, filename: str, cache_control: Optional[bytes]=None):
+        """
+        Send a file as a complete 200 response without reading it into memory.
+        The headers go out in a single write and the body is handed to the
+        kernel via socket.sendfile, falling back to a chunked copy when
+        sendfile is not available.
+        """
+
+        try:
+            ct, en = mimetypes.guess_file_type(filename)
+        except AttributeError:
+            ct, en = mimetypes.guess_type(filename)
+
+        with open(filename, 'rb') as fh:
+            st = os.fstat(fh.fileno())
+
+            try:
+                preamble = _PREAMBLE_CACHE[ct]
+            except KeyError:
+                preamble = b'HTTP/1.1 200 OK\r\n' + _SERVER_LINE \
+                           + b'Content-Type: ' + ct.encode('ascii') + b'\r\n'
+                _PREAMBLE_CACHE[ct] = preamble
+
+            headers = preamble + _date_header()
+            if en is not None:
+                headers += b'Content-Encoding: ' + en.encode('ascii') + b'\r\n'
+            headers += b'Last-Modified: ' + timestamp_to_rfc2822(st.st_mtime).encode('ascii') + b'\r\n'
+            headers += b'ETag: ' + _file_etag(st).encode('ascii') + b'\r\n'
+            if cache_control is not None:
+                headers += cache_control
+            headers += b'Content-Length: ' + str(st.st_size).encode('ascii') + b'\r\n\r\n'
+
+            self.wfile.write(headers)
+            self.wfile.flush()
+            try:
+                self.connection.sendfile(fh)
+            except (AttributeError, OSError):
+                shutil.copyfileobj(fh, self.wfile, 64*1024)
+        self.log_request(200)
+
     def do_GET(self):
-        m = _getRE.search(self.requestline)
-        if m:
-            self.handle_request(m.group(1))
-        else:
-            self.send_response(500)
-            self.wfile.write(bytes('Internal Error - parsing request', 'utf-8'))
-            
+        self.handle_request(self.path)
+
     def handle_request(self, req: str):
-        params = {}
-        if req.find('?') != -1:
-            req, params = req.split('?', 1)
-            params = params.split('&')
-            params = {entry.split('=')[0]: unquote_plus(entry.split('=')[1]) for entry in params}
-            for key in params:
-                value = params[key]
-                if value.lower() == 'true':
-                    value = True
-                elif value.lower() == 'false':
-                    value = False
-                else:
-                    try:
-                        value = int(value, 10)
-                    except ValueError:
-                        try:
-                            value = float(value)
-                        except ValueError:
-                            pass
-                params[key] = value
-                
-        if req == '/':
-            req = '/index.html'
-        elif req == '/favicon.ico':
-            req = '/images/favicon.ico'
-        elif req == '/previous/details.html':
-            req = '/details.html'
-            
+        parts = urlsplit(req)
+        req = parts.path
+        params = {key: _coerce(value) for key, value in parse_qsl(parts.query, keep_blank_values=True)}
+
+        req = _REWRITES.get(req, req)
+
+
         try:
-            handler = self._handlers[req]
-            handler(self, params)
-            
-        except KeyError:
-            self.get_static_asset(req, params)
-            
+            handler = self._handlers.get(req)
+            if handler is not None:
+                handler(self, params)
+            else:
+                self.get_static_asset(req, params)
+
         except URLNotFoundError:
-            self.send_response(404)
-            self.send_header('Content-Type', 'text/plain')
-            self.end_headers()
+            self.send_plain_error(404, _404_PREAMBLE, _404_INACTIVE_BODY)
 
-            self.wfile.write(bytes('The requested URL was not found on this server because a capture is not active.', 'utf-8'))
-            
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-Type', 'text/plain')
-            self.end_headers()
-            
-            self.wfile.write(bytes('Internal Error - processing request', 'utf-8'))
+            if self.debug:
+                self.log_error("Error processing '%s': %s", req, traceback.format_exc())
+
+            self.send_plain_error(500, _500_PREAMBLE, _500_BODY)
             
     @HandlerRegistry.register('/latest')
     def get_latest_status(self, params: Dict[str,Any]):
         mtime = self.server.last_modified
-        
-        if self.headers.get('If-Modified-Since') == mtime:
-            self.send_response(304)
-            self.send_header('Last-Modified', mtime)
-            self.send_header('Cache-Control', 'max-age=30, must-revalidate')
-            self.end_headers()
+        gzipped = self.accepts_gzip()
+        etag = self.server.data_etag
+        if gzipped:
+            # The gzip and identity bodies are different representations of
+            # the same resource and must not share a strong ETag
+            etag = etag[:-1] + '-gz"'
+
+        if self.headers.get('If-None-Match') == etag \
+           or self.headers.get('If-Modified-Since') == mtime:
+            self.send_not_modified(mtime, cache_control=_CACHE_CONTROL_30,
+                                   etag=etag, vary=_VARY_ACCEPT_ENCODING)
             return
-            
-        data = self.server.get_data()
-        
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Last-Modified', mtime)
-        self.send_header('Cache-Control', 'max-age=30, must-revalidate')
-        self.end_headers()
-
-        self.wfile.write(bytes(json.dumps(data), "utf-8"))
-        self.wfile.flush()
+
+        data = self.server.get_data_json(gzipped=gzipped)
+
+        self.send_ok(data,
+                     content_encoding='gzip' if gzipped else None,
+                     last_modified=mtime,
+                     cache_control=_CACHE_CONTROL_30,
+                     etag=etag,
+                     vary=_VARY_ACCEPT_ENCODING)
         
     @HandlerRegistry.register('/latest/image')
     def get_latest_image(self, params: Dict[str,Any]):
@@ -334,48 +730,35 @@ class  TelemetryHandler(BaseHTTPRequestHandler):
         if filename is None:
             raise URLNotFoundError()
             
-        mtime = os.path.getmtime(filename)
-        mtime = timestamp_to_rfc2822(mtime)
-        
-        if self.headers.get('If-Modified-Since') == mtime:
-            self.send_response(304)
-            self.send_header('Last-Modified', mtime)
-            self.send_header('Cache-Control', 'max-age=30, must-revalidate')
-            self.end_headers()
+        st = os.stat(filename)
+        mtime = timestamp_to_rfc2822(st.st_mtime)
+        etag = _file_etag(st)
+
+        if self.headers.get('If-None-Match') == etag \
+           or self.headers.get('If-Modified-Since') == mtime:
+            self.send_not_modified(mtime, cache_control=_CACHE_CONTROL_30,
+                                   etag=etag)
             return
-            
-        data = get_image_data(filename)
-        
-        self.send_response(200)
-        self.send_header('Content-Type', data['content-type'])
-        self.send_header('Last-Modified', data['last-modified'])
-        self.send_header('Cache-Control', 'max-age=30, must-revalidate')
-        self.end_headers()
-        
-        self.wfile.write(data['data'])
-        self.wfile.flush()
+
+        self.send_file_ok(filename, cache_control=_CACHE_CONTROL_30)
         
     @HandlerRegistry.register('/system')
     def get_latest_system(self, params: Dict[str,Any]):
         mtime = self.server.system_last_modified
         
         if self.headers.get('If-Modified-Since') == mtime:
-            self.send_response(304)
-            self.send_header('Last-Modified', mtime)
-            self.send_header('Cache-Control', 'max-age=30, must-revalidate')
-            self.end_headers()
+            self.send_not_modified(mtime, cache_control=_CACHE_CONTROL_30,
+                                   vary=_VARY_ACCEPT_ENCODING)
             return
-            
-        data = self.server.get_system_data()
-        
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Last-Modified', mtime)
-        self.send_header('Cache-Control', 'max-age=30, must-revalidate')
-        self.end_headers()
-
-        self.wfile.write(bytes(json.dumps(data), "utf-8"))
-        self.wfile.flush()
+
+        gzipped = self.accepts_gzip()
+        data = self.server.get_system_data_json(gzipped=gzipped)
+
+        self.send_ok(data,
+                     content_encoding='gzip' if gzipped else None,
+                     last_modified=mtime,
+                     cache_control=_CACHE_CONTROL_30,
+                     vary=_VARY_ACCEPT_ENCODING)
         
     @HandlerRegistry.register('/previous')
     def get_previous_status(self, params: Dict[str,Any]):
@@ -386,46 +769,39 @@ class  TelemetryHandler(BaseHTTPRequestHandler):
         mtime = self.server.previous_last_modified
         
         if self.headers.get('If-Modified-Since') == mtime:
-            self.send_response(304)
-            self.send_header('Last-Modified', mtime)
-            self.send_header('Cache-Control', 'max-age=300, must-revalidate')
-            self.end_headers()
+            self.send_not_modified(mtime, cache_control=_CACHE_CONTROL_300,
+                                   vary=_VARY_ACCEPT_ENCODING)
             return
-            
-        data = self.server.get_previous_data(date=date)
-        if data is None:
+
+        entry = self.server.get_previous_data(date=date)
+        if entry is None:
             raise URLNotFoundError()
-            
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Last-Modified', mtime)
-        self.send_header('Cache-Control', 'max-age=300, must-revalidate')
-        self.end_headers()
-
-        self.wfile.write(bytes(json.dumps(data), "utf-8"))
-        self.wfile.flush()
+
+        body = entry['payload']
+        encoding = None
+        if self.accepts_gzip():
+            body = entry['gzip-payload']
+            encoding = 'gzip'
+
+        self.send_ok(body,
+                     content_encoding=encoding,
+                     last_modified=mtime,
+                     cache_control=_CACHE_CONTROL_300,
+                     vary=_VARY_ACCEPT_ENCODING)
         
     @HandlerRegistry.register('/previous/dates')
     def get_previous_dates(self, params: Dict[str,Any]):
         mtime = self.server.previous_last_modified
         
         if self.headers.get('If-Modified-Since') == mtime:
-            self.send_response(304)
-            self.send_header('Last-Modified', mtime)
-            self.send_header('Cache-Control', 'max-age=300, must-revalidate')
-            self.end_headers()
+            self.send_not_modified(mtime, cache_control=_CACHE_CONTROL_300)
             return
             
         data = self.server.get_previous_dates()
-        
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Last-Modified', mtime)
-        self.send_header('Cache-Control', 'max-age=300, must-revalidate')
-        self.end_headers()
-
-        self.wfile.write(bytes(json.dumps(data), "utf-8"))
-        self.wfile.flush()
+
+        self.send_ok(_dumps(data),
+                     last_modified=mtime,
+                     cache_control=_CACHE_CONTROL_300)
         
     @HandlerRegistry.register('/previous/radiants')
     def get_previous_radiants(self, params: Dict[str,Any]):
@@ -437,26 +813,17 @@ class  TelemetryHandler(BaseHTTPRequestHandler):
         if filename is None:
             raise URLNotFoundError()
             
-        mtime = os.path.getmtime(filename)
-        mtime = timestamp_to_rfc2822(mtime)
-        
-        if self.headers.get('If-Modified-Since') == mtime:
-            self.send_response(304)
-            self.send_header('Last-Modified', mtime)
-            self.send_header('Cache-Control', 'max-age=300, must-revalidate')
-            self.end_headers()
+        st = os.stat(filename)
+        mtime = timestamp_to_rfc2822(st.st_mtime)
+        etag = _file_etag(st)
+
+        if self.headers.get('If-None-Match') == etag \
+           or self.headers.get('If-Modified-Since') == mtime:
+            self.send_not_modified(mtime, cache_control=_CACHE_CONTROL_300,
+                                   etag=etag)
             return
-            
-        data = get_image_data(filename)
-        
-        self.send_response(200)
-        self.send_header('Content-Type', data['content-type'])
-        self.send_header('Last-Modified', data['last-modified'])
-        self.send_header('Cache-Control', 'max-age=300, must-revalidate')
-        self.end_headers()
-        
-        self.wfile.write(data['data'])
-        self.wfile.flush()
+
+        self.send_file_ok(filename, cache_control=_CACHE_CONTROL_300)
         
     @HandlerRegistry.register('/previous/image')
     def get_previous_image(self, params: Dict[str,Any]):
@@ -468,26 +835,17 @@ class  TelemetryHandler(BaseHTTPRequestHandler):
         if filename is None:
             raise URLNotFoundError()
             
-        mtime = os.path.getmtime(filename)
-        mtime = timestamp_to_rfc2822(mtime)
-        
-        if self.headers.get('If-Modified-Since') == mtime:
-            self.send_response(304)
-            self.send_header('Last-Modified', mtime)
-            self.send_header('Cache-Control', 'max-age=300, must-revalidate')
-            self.end_headers()
+        st = os.stat(filename)
+        mtime = timestamp_to_rfc2822(st.st_mtime)
+        etag = _file_etag(st)
+
+        if self.headers.get('If-None-Match') == etag \
+           or self.headers.get('If-Modified-Since') == mtime:
+            self.send_not_modified(mtime, cache_control=_CACHE_CONTROL_300,
+                                   etag=etag)
             return
-            
-        data = get_image_data(filename)
-        
-        self.send_response(200)
-        self.send_header('Content-Type', data['content-type'])
-        self.send_header('Last-Modified', data['last-modified'])
-        self.send_header('Cache-Control', 'max-age=300, must-revalidate')
-        self.end_headers()
-        
-        self.wfile.write(data['data'])
-        self.wfile.flush()
+
+        self.send_file_ok(filename, cache_control=_CACHE_CONTROL_300)
         
     @HandlerRegistry.register('/previous/details')
     def get_previous_details(self, params: Dict[str,Any]):
@@ -497,14 +855,14 @@ class  TelemetryHandler(BaseHTTPRequestHandler):
             
         mtime = self.server.previous_last_modified
         
-        data = self.server.get_previous_data(date=date)
-        if data is None:
+        entry = self.server.get_previous_data(date=date)
+        if entry is None:
             raise URLNotFoundError()
-            
-        station_id = data['station_id']
-        started = data['capture']['started']
+
+        station_id = entry['station_id']
+        started = entry['started']
         date = started[:10].replace('-', '')
-        n_meteor_final = data['detections']['n_meteor_final']
+        n_meteor_final = entry['n_meteor_final']
         data = get_meteor_details(self.server.log_dir, date=date)
         if data is None:
             raise URLNotFoundError()
@@ -514,15 +872,10 @@ class  TelemetryHandler(BaseHTTPRequestHandler):
                 'n_meteor_final': n_meteor_final,
                 'meteors': data
                }
-        
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Last-Modified', mtime)
-        self.send_header('Cache-Control', 'max-age=300, must-revalidate')
-        self.end_headers()
-
-        self.wfile.write(bytes(json.dumps(data), "utf-8"))
-        self.wfile.flush()
+
+        self.send_ok(_dumps(data),
+                     last_modified=mtime,
+                     cache_control=_CACHE_CONTROL_300)
         
     @HandlerRegistry.register('/previous/meteor')
     def get_previous_meteor(self, params: Dict[str,Any]):
@@ -550,49 +903,37 @@ class  TelemetryHandler(BaseHTTPRequestHandler):
             fits_to_movie(filename, tstart=date, duration=duration)
         else:
             fits_to_image(filename)
-        data = get_image_data(filename.replace('.fits', format))
-        if data is None:
+        filename = filename.replace('.fits', format)
+        if not os.path.exists(filename):
             raise URLNotFoundError()
-            
-        self.send_response(200)
-        self.send_header('Content-Type', data['content-type'])
-        self.send_header('Last-Modified', data['last-modified'])
-        self.send_header('Cache-Control', 'max-age=300, must-revalidate')
-        self.end_headers()
-        
-        self.wfile.write(data['data'])
-        self.wfile.flush()
+
+        self.send_file_ok(filename, cache_control=_CACHE_CONTROL_300)
         
     def get_static_asset(self, req: str, params: Dict[str,Any]):
         filename = get_asset(req)
         
         if filename:
-            mtime = os.path.getmtime(filename)
-            mtime = timestamp_to_rfc2822(mtime)
-            
+            data = get_asset_data(filename)
+            mtime = data['last-modified']
+
             if self.headers.get('If-Modified-Since') == mtime:
-                self.send_response(304)
-                self.send_header('Last-Modified', mtime)
-                self.send_header('Cache-Control', 'max-age=600, must-revalidate')
-                self.end_headers()
+                self.send_not_modified(mtime, cache_control=_CACHE_CONTROL_600,
+                                       vary=_VARY_ACCEPT_ENCODING)
                 return
-                
-            data = get_asset_data(filename)
-            
-            self.send_response(200)
-            self.send_header('Content-Type', data['content-type'])
-            if data['content-encoding'] is not None:
-                self.send_header('Content-Encoding', data['content-encoding'])
-            self.send_header('Last-Modified', data['last-modified'])
-            self.send_header('Cache-Control', 'max-age=600, must-revalidate')
-            self.end_headers()
-            
-            self.wfile.write(data['data'])
-            
-        else:
-            self.send_response(404)
-            self.send_header('Content-Type', 'text/plain')
-            self.end_headers()
 
-            self.wfile.write(bytes('The requested URL was not found on this server.', 'utf-8'))
+            body = data['data']
+            encoding = data['content-encoding']
+            if 'gzip-data' in data and self.accepts_gzip():
+                body = data['gzip-data']
+                encoding = 'gzip'
+
+            self.send_ok(body,
+                         content_type=data['content-type'],
+                         content_encoding=encoding,
+                         last_modified=mtime,
+                         cache_control=_CACHE_CONTROL_600,
+                         vary=_VARY_ACCEPT_ENCODING)
+
+        else:
+            self.send_plain_error(404, _404_PREAMBLE, _404_BODY)
             
@@ -1,5 +1,5 @@
 import os
-import glob
+import gzip
 import mimetypes
 from functools import lru_cache
 
@@ -50,26 +50,48 @@ def get_asset(request_path: str) -> Optional[str]:
     return filename
 
 
-@lru_cache(maxsize=32)
+# Cache of loaded assets keyed by filename, validated against the file's
+# st_mtime_ns so a changed file invalidates naturally
+_ASSET_CACHE = {}
+
+
 def get_asset_data(filename: str) -> Dict[str,Any]:
     """
     Given a filename that supposedly points to a static file, validate that it
     really is a static file, and then load the file and return a dictionary
-    containing the file's content type and data.  Returns and empty dictionary
-    if the file doesn't exist.
+    containing the file's content type and data.  Repeat requests for an
+    unchanged file are served from an in-memory cache at the cost of a single
+    stat call.  Returns and empty dictionary if the file doesn't exist.
     """
-    
+
     data = {}
-    
+
     if is_valid_asset(filename):
+        st = os.stat(filename)
+        try:
+            mtime_ns, data = _ASSET_CACHE[filename]
+            if mtime_ns == st.st_mtime_ns:
+                return data
+        except KeyError:
+            pass
+
+        data = {}
         try:
             ct, en = mimetypes.guess_file_type(filename)
         except AttributeError:
             ct, en = mimetypes.guess_type(filename)
         data['content-type'] = ct
         data['content-encoding'] = en
-        data['last-modified'] = timestamp_to_rfc2822(os.path.getmtime(filename))
+        data['last-modified'] = timestamp_to_rfc2822(st.st_mtime)
         with open(filename, 'rb') as fh:
             data['data'] = fh.read()
-            
+        if en is None:
+            # Compress once at load time so a gzip-capable client never pays
+            # for compression at request time - but only keep the variant if
+            # it actually helps (images generally don't)
+            gz = gzip.compress(data['data'], 9)
+            if len(gz) < len(data['data']):
+                data['gzip-data'] = gz
+        _ASSET_CACHE[filename] = (st.st_mtime_ns, data)
+
     return data
@@ -1,5 +1,9 @@
+import os
+import re
 import time
-import subprocess
+import fcntl
+import socket
+import struct
 from collections import namedtuple
 
 from .utils import timestamp_to_iso, now_as_iso, timed_lru_cache
@@ -19,89 +23,82 @@ def get_disk_info(log_dir: str) -> Dict[str,Any]:
     
     data = {}
     try:
-        dt = now_as_iso()
-        info = subprocess.check_output(['df','-B1000', log_dir],
-                                       text=True)
-        for line in info.split('\n'):
-            if line.startswith('Filesystem'):
-                continue
-            if len(line) < 3:
-                continue
-                
-            _, total, used, free, _, _ = line.split(None, 5)
-            total = int(total, 10) / 1000**2 # kB -> GB
-            used = int(used, 10) / 1000**2 # kB -> GB
-            free = int(free, 10) / 1000**2 # kB -> GB
-            data['total_gb'] = total
-            data['used_gb'] = used
-            data['free_gb'] = free
-            data['updated'] = dt
-    except subprocess.CalledProcessError as e:
+        st = os.statvfs(log_dir)
+        data['total_gb'] = st.f_blocks * st.f_frsize / 1000**3
+        data['used_gb'] = (st.f_blocks - st.f_bfree) * st.f_frsize / 1000**3
+        data['free_gb'] = st.f_bavail * st.f_frsize / 1000**3
+        data['updated'] = now_as_iso()
+    except OSError as e:
         print(f"WARNING: Failed to determine the disk usage: {str(e)}")
-        
+
     return data
 
 
+# Fields to pull out of /proc/meminfo and what to call them - all three sit
+# in the first few lines of the file so only the head needs to be read
+_MEM_RE = re.compile(r'(MemTotal|MemFree|MemAvailable):\s+(\d+)')
+_MEM_FIELDS = {'MemTotal': 'total_gb',
+               'MemFree': 'free_gb',
+               'MemAvailable': 'available_gb'}
+
+
 @timed_lru_cache(seconds=60)
 def get_memory_info(log_dir: str) -> Dict[str,Any]:
     """
     Poll the memory usage and return the results as a dictionary.
     """
-    
+
     data = {}
     with open('/proc/meminfo', 'r') as fh:
-        for line in fh:
-            if line.startswith('MemTotal:'):
-                _, value, units = line.split(None, 2)
-                value = int(value, 10)
-                data['total_gb'] = value / 1000**2
-            elif line.startswith('MemFree:'):
-                _, value, units = line.split(None, 2)
-                value = int(value, 10)
-                data['free_gb'] = value / 1000**2
-            elif line.startswith('MemAvailable:'):
-                _, value, units = line.split(None, 2)
-                value = int(value, 10)
-                data['available_gb'] = value / 1000**2
-                break
-                
+        head = fh.read(256)
+    for mtch in _MEM_RE.finditer(head):
+        data[_MEM_FIELDS[mtch.group(1)]] = int(mtch.group(2), 10) / 1000**2
+
     data['updated'] = now_as_iso()
     return data
 
 
+# The hostname does not change between boots, so read it once at import time
+try:
+    with open('/etc/hostname', 'r') as fh:
+        _HOSTNAME = fh.read().strip()
+except OSError:
+    _HOSTNAME = socket.gethostname()
+
+
 @timed_lru_cache(seconds=60)
 def get_system_info(log_dir: str) -> Dict[str,Any]:
     """
     Poll system information (hostname, uptime, load, etc.) and return the
     results as a dictionary.
     """
-    
+
     data = {}
-    
+
     # Hostname
-    with open('/etc/hostname', 'r') as fh:
-        data['hostname'] = fh.read().strip()
-        
-    # Uptime
-    with open('/proc/uptime', 'r') as fh:
-        fields = fh.read().split(None)
-        uptime = int(float(fields[0]))
-        days = uptime // 86400
-        hours = uptime // 3600 % 24
-        minutes = uptime // 60 % 60
-        seconds = uptime % 60
-        
-        value = ''
-        if days > 0:
-            value = f"{days} days, {hours}:{minutes:02d}"
-        elif hours > 0:
-            value = f"{hours}:{minutes:02d}"
-        elif minutes > 0:
-            value = f"{minutes} min"
-        else:
-            value = f"{seconds} s"
-        data['uptime'] = value
-        
+    data['hostname'] = _HOSTNAME
+
+
+    # Uptime - CLOCK_BOOTTIME counts seconds since boot, including time
+    # spent suspended, so it matches what /proc/uptime reports without the
+    # file read and float parse
+    uptime = int(time.clock_gettime(time.CLOCK_BOOTTIME))
+    minutes, seconds = divmod(uptime, 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+
+    value = ''
+    if days > 0:
+        value = f"{days} days, {hours}:{minutes:02d}"
+    elif hours > 0:
+        value = f"{hours}:{minutes:02d}"
+    elif minutes > 0:
+        value = f"{minutes} min"
+    else:
+        value = f"{seconds} s"
+    data['uptime'] = value
+
+
     # Load averages
     with open('/proc/loadavg', 'r') as fh:
         fields = fh.read().split(None)
@@ -126,6 +123,25 @@ _NETWORK_CACHE = {'addr': {},
 # Helper for storing network stats
 NetStats = namedtuple('NetStats', ['t', 'rx', 'tx'])
 
+# ioctl request number for querying the IPv4 address of an interface
+_SIOCGIFADDR = 0x8915
+
+
+def _get_ip_address(dev: str) -> Optional[str]:
+    """
+    Look up the IPv4 address assigned to a network interface directly from the
+    kernel.  Returns None if the interface does not have an address.
+    """
+
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        try:
+            info = fcntl.ioctl(s.fileno(), _SIOCGIFADDR,
+                               struct.pack('256s', bytes(dev[:15], 'utf-8')))
+        except OSError:
+            return None
+
+    return socket.inet_ntoa(info[20:24])
+
 @timed_lru_cache(seconds=60)
 def get_network_info(log_dir: str) -> Dict[str,Any]:
     """
@@ -137,41 +153,31 @@ def get_network_info(log_dir: str) -> Dict[str,Any]:
     
     data = {}
     
-    # Get the current interface statistics
+    # Get the current interface statistics - read the whole file at once,
+    # skip the two header lines, and stop splitting after the tx_bytes field
+    # since nothing past it is used
     t0 = time.time()
     new_stat = {}
-    with open('/proc/net/dev', 'r') as fh:
-        for line in fh:
-            if line.startswith('Inter-') or line.startswith(' face'):
-                continue
-            if len(line) < 3:
-                continue
-                
-            fields = line.strip().split()
-            dev = fields[0].replace(':', '')
-            if dev == 'lo':
-                continue
-            rx_bytes, tx_bytes = int(fields[1], 10), int(fields[9], 10)
-            new_stat[dev] = NetStats(t0, rx_bytes, tx_bytes)
-            
+    with open('/proc/net/dev', 'rb') as fh:
+        buf = fh.read()
+    for line in buf.splitlines()[2:]:
+        fields = line.split(None, 10)
+        if len(fields) < 10:
+            continue
+
+        dev = fields[0].rstrip(b':')
+        if dev == b'lo':
+            continue
+        rx_bytes, tx_bytes = int(fields[1], 10), int(fields[9], 10)
+        new_stat[dev.decode()] = NetStats(t0, rx_bytes, tx_bytes)
+
     # Refresh the address list, if needed
     for dev in new_stat:
         if dev not in _NETWORK_CACHE['addr']:
-            try:
-                addr_info = subprocess.check_output(['ip', 'address', 'show', 'dev', dev],
-                                                    text=True)
-                
-                for line in addr_info.split('\n'):
-                    line = line.strip()
-                    if line.startswith('inet '):
-                        _, addr, _ = line.split(None, 2)
-                        addr, _ = addr.split('/', 1)
-                        _NETWORK_CACHE['addr'][dev] = addr
-            except subprocess.CalledProcessError as e:
-                print(f"WARNING: failed to query IP address for '{dev}': {str(e)}")
-            except Exception as e:
-                print(f"WARNING: failed to determine IP address for '{dev}': {str(e)}")
-                
+            addr = _get_ip_address(dev)
+            if addr is not None:
+                _NETWORK_CACHE['addr'][dev] = addr
+
     # Compute lifetime bytes received/transmitted and current average data rates
     old_stat = _NETWORK_CACHE['stat']
     for dev in new_stat:
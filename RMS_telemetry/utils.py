@@ -1,13 +1,15 @@
 import os
-import glob
 import time
-import calendar
-from datetime import datetime
-from functools import lru_cache, wraps
+from datetime import datetime, timezone
+from functools import cache, lru_cache, wraps
 
 from typing import Optional, Union
 
 
+# UTC tzinfo, bound once
+_UTC = timezone.utc
+
+
 __all__ = ['get_archive_dir', 'get_capture_dir', 'get_frames_dir',
            'datetime_to_iso', 'iso_to_datetime', 'timestamp_to_iso',
            'iso_to_timestamp', 'now_as_iso', 'iso_age', 'datetime_to_rfc2822',
@@ -21,16 +23,46 @@ def datetime_to_iso(dt: datetime) -> str:
     """
     
     iso = dt.isoformat()
-    iso = iso.rsplit('.')[0]
+    iso, _, _ = iso.partition('.')
+    iso, _, _ = iso.partition('+')
     return iso+'Z'
 
 
+def _parse_fixed_iso(iso: str) -> datetime:
+    """
+    Parse the fixed 'YYYY-MM-DDTHH:MM:SSZ' layout used throughout the package
+    by slicing directly into the string, which skips fromisoformat's general
+    format handling.  Anything else falls through to fromisoformat.
+    """
+
+    if len(iso) == 20 and iso[-1] == 'Z':
+        try:
+            return datetime(int(iso[0:4]), int(iso[5:7]), int(iso[8:10]),
+                            int(iso[11:13]), int(iso[14:16]), int(iso[17:19]))
+        except ValueError:
+            pass
+
+    if iso.endswith('Z'):
+        iso = iso[:-1]
+    return datetime.fromisoformat(iso)
+
+
 def iso_to_datetime(iso: str) -> datetime:
     """
     Convert a ISO8601 timestamp into a datetime instance.
     """
-    
-    return datetime.fromisoformat(iso.replace('Z', ''))
+
+    return _parse_fixed_iso(iso)
+
+
+@lru_cache(maxsize=4)
+def _iso_for_int(ts: int) -> str:
+    """
+    Cached worker for timestamp_to_iso, keyed on integer seconds since that
+    is all the resolution the output carries anyway.
+    """
+
+    return datetime_to_iso(datetime.fromtimestamp(ts, _UTC))
 
 
 def timestamp_to_iso(ts: Union[int,float]) -> str:
@@ -38,18 +70,17 @@ def timestamp_to_iso(ts: Union[int,float]) -> str:
     Convert a UNIX timestamp into a ISO8601 format that doesn't contain
     fractions of a second.
     """
-    dt = datetime.utcfromtimestamp(ts)
-    return datetime_to_iso(dt)
+
+    return _iso_for_int(int(ts))
 
 
 def iso_to_timestamp(iso: str) -> float:
     """
     Convert a ISO8601 timestamp into a UNIX timestamp
     """
-    
+
     dt = iso_to_datetime(iso)
-    tt = dt.timetuple()
-    return calendar.timegm(tt) + dt.microsecond/1e6
+    return dt.replace(tzinfo=timezone.utc).timestamp()
 
 
 def now_as_iso() -> str:
@@ -61,6 +92,35 @@ def now_as_iso() -> str:
     return timestamp_to_iso(time.time())
 
 
+# Cumulative days before the start of each month in a non-leap year, indexed
+# by month number (entry 0 is unused)
+_MONTH_DAYS = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+
+def _iso_to_epoch(iso: str) -> float:
+    """
+    Convert a ISO8601 timestamp directly into seconds since the UNIX epoch.
+    For the fixed 'YYYY-MM-DDTHH:MM:SSZ' layout this is pure integer
+    arithmetic with no intermediate datetime; anything else falls back to
+    the datetime-based conversion.
+    """
+
+    if len(iso) == 20 and iso[-1] == 'Z':
+        try:
+            y = int(iso[0:4])
+            m = int(iso[5:7])
+            days = (y - 1970)*365 + (y - 1969)//4 - (y - 1901)//100 + (y - 1601)//400
+            days += _MONTH_DAYS[m] + int(iso[8:10]) - 1
+            if m > 2 and y % 4 == 0 and (y % 100 != 0 or y % 400 == 0):
+                days += 1
+            return days*86400 + int(iso[11:13])*3600 + int(iso[14:16])*60 \
+                   + int(iso[17:19])
+        except (ValueError, IndexError):
+            pass
+
+    return iso_to_timestamp(iso)
+
+
 def iso_age(iso: str, ref: Optional[str]=None) -> float:
     """
     Given a ISO8601 time, figure out how old the timestamp is and return that
@@ -71,30 +131,163 @@ def iso_age(iso: str, ref: Optional[str]=None) -> float:
     """
     
     if ref is None:
-        ref = datetime.utcnow()
+        ref_epoch = time.time()
     else:
-        ref = iso_to_datetime(ref)
-    dt = iso_to_datetime(iso)
-    
-    age = ref - dt
-    return age.total_seconds()
+        ref_epoch = _iso_to_epoch(ref)
+
+    return ref_epoch - _iso_to_epoch(iso)
+
+
+# Fixed English day and month abbreviations for RFC2822 times - the format
+# never varies with locale, so skip strftime's locale-aware machinery
+_DOW = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+_MON = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+        'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
 
 
 def datetime_to_rfc2822(dt: datetime) -> str:
     """
-    Convert a datetime instance into a RFC2822 time.
+    Convert a datetime instance into a RFC2822 time.  The datetime is assumed
+    to be in UTC.
     """
-    
-    return dt.strftime('%a, %d %b %Y %X %z').strip()
+
+    return f"{_DOW[dt.weekday()]}, {dt.day:02d} {_MON[dt.month-1]} {dt.year:04d} {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d} +0000"
+
+
+@lru_cache(maxsize=4)
+def _rfc2822_for_int(ts: int) -> str:
+    """
+    Cached worker for timestamp_to_rfc2822, keyed on integer seconds since
+    that is all the resolution the output carries anyway.
+    """
+
+    return datetime_to_rfc2822(datetime.fromtimestamp(ts, _UTC))
 
 
 def timestamp_to_rfc2822(ts: Union[int,float]) -> str:
     """
     Convert a UNIX timestamp into a RFC2822 time.
     """
-    
-    dt = datetime.utcfromtimestamp(ts)
-    return datetime_to_rfc2822(dt)
+
+    return _rfc2822_for_int(int(ts))
+
+
+def timed_lru_cache(seconds: int=600, maxsize: Optional[int]=8, typed: bool=False):
+    """
+    Sub-class for `functools.lru_cache` that includes a lifetime for cached
+    calls.  Useful for caching results for web services.  A maxsize of None
+    selects `functools.cache`, which skips the LRU bookkeeping entirely for
+    callers with a small, bounded set of arguments.
+    """
+
+    def decorator(func):
+        if maxsize is None:
+            func = cache(func)
+        else:
+            func = lru_cache(maxsize=maxsize, typed=typed)(func)
+        lifetime_ns = seconds * 1000000000
+        # Bind the hot names as closure locals so the wrapper avoids the
+        # global and attribute lookups on every call.  The deadline is a
+        # single-element list so it can be updated without a nonlocal
+        # rebind; the update isn't locked but the worst case is two threads
+        # both clearing the cache, which is harmless.
+        _time = time.monotonic_ns
+        _clear = func.cache_clear
+        deadline = [_time() + lifetime_ns]
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            # Check if cache has expired
+            now = _time()
+            if now >= deadline[0]:
+                deadline[0] = now + lifetime_ns
+                _clear()
+            return func(*args, **kwargs)
+
+        return wrapper
+    return decorator
+
+
+def _latest_subdir(parent: str, needle: Optional[str]=None) -> Optional[str]:
+    """
+    Scan a directory and return the most recently modified sub-directory,
+    optionally restricted to entries whose name contains `needle`.  Returns
+    None if there is no match or the directory cannot be read.
+    """
+
+    latest_entry = None
+    latest_mtime = 0
+    try:
+        with os.scandir(parent) as entries:
+            for entry in entries:
+                if needle and entry.name.find(needle) == -1:
+                    continue
+                if not entry.is_dir():
+                    continue
+
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest_entry = entry.path
+                    latest_mtime = mtime
+    except OSError:
+        pass
+
+    return latest_entry
+
+
+def _dated_subdir(parent: str, date: str, depth: int) -> Optional[str]:
+    """
+    Find the sub-directory for a YYYYMMDD date at a given depth of the frames
+    tree - the year directory at depth 0, the month directory at depth 1, and
+    the night directory at depth 2.  The scan stops at the first match since
+    each level holds at most one directory per date.  Returns None if there is
+    no match or the directory cannot be read.
+    """
+
+    if depth == 0:
+        name = date[:4]
+    elif depth == 1:
+        name = date[:6]
+    else:
+        name = None
+
+    try:
+        with os.scandir(parent) as entries:
+            for entry in entries:
+                if name is not None:
+                    if entry.name != name:
+                        continue
+                elif not entry.name.startswith(date):
+                    continue
+                if entry.is_dir():
+                    return entry.path
+    except OSError:
+        pass
+
+    return None
+
+
+@lru_cache(maxsize=16)
+def _sibling_abspath(log_dir: str, sibling: str) -> str:
+    """
+    Resolve the path of a directory that sits alongside the RMS log directory.
+    The log directory is fixed for the life of the process so the result is
+    cached, and normpath is used instead of abspath to skip the getcwd call
+    when the log directory is already absolute.
+    """
+
+    return os.path.normpath(os.path.join(log_dir, '..', sibling))
+
+
+@timed_lru_cache(seconds=60, maxsize=32)
+def _latest_sibling_dir(log_dir: str, sibling: str, date: Optional[str]=None) -> Optional[str]:
+    """
+    Find the most recently modified sub-directory of a directory that sits
+    alongside the RMS log directory, optionally restricted to a YYYYMMDD
+    date.  Returns None if the directory cannot be determined.
+    """
+
+    return _latest_subdir(_sibling_abspath(log_dir, sibling), date)
 
 
 def get_archive_dir(log_dir: str, date: Optional[str]=None) -> Optional[str]:
@@ -103,26 +296,8 @@ def get_archive_dir(log_dir: str, date: Optional[str]=None) -> Optional[str]:
     format, return the corresponding archive directory.  Return None if the
     directory cannot be determined.
     """
-    
-    data_dir = os.path.join(log_dir, '..', 'ArchivedFiles')
-    data_dir = os.path.abspath(data_dir)
-    
-    entries = glob.glob(os.path.join(data_dir, '*'))
-    if date:
-        entries = list(filter(lambda x: x.find(date) != -1, entries))
-        
-    latest_entry = None
-    latest_mtime = 0
-    for entry in entries:
-        if not os.path.isdir(entry):
-            continue
-            
-        mtime = os.path.getmtime(entry)
-        if mtime > latest_mtime:
-            latest_entry = entry
-            latest_mtime = mtime
-            
-    return latest_entry
+
+    return _latest_sibling_dir(log_dir, 'ArchivedFiles', date=date)
 
 
 def get_capture_dir(log_dir: str, date: Optional[str]=None) -> Optional[str]:
@@ -131,81 +306,32 @@ def get_capture_dir(log_dir: str, date: Optional[str]=None) -> Optional[str]:
     format, return the corresponding captured files directory.  Return None if
     the directory cannot be determined.
     """
-    
-    data_dir = os.path.join(log_dir, '..', 'CapturedFiles')
-    data_dir = os.path.abspath(data_dir)
-    
-    entries = glob.glob(os.path.join(data_dir, '*'))
-    if date:
-        entries = list(filter(lambda x: x.find(date) != -1, entries))
-        
-    latest_entry = None
-    latest_mtime = 0
-    for entry in entries:
-        if not os.path.isdir(entry):
-            continue
-            
-        mtime = os.path.getmtime(entry)
-        if mtime > latest_mtime:
-            latest_entry = entry
-            latest_mtime = mtime
-            
-    return latest_entry
 
+    return _latest_sibling_dir(log_dir, 'CapturedFiles', date=date)
 
+
+@timed_lru_cache(seconds=60, maxsize=32)
 def get_frames_dir(log_dir: str, date: Optional[str]=None) -> Optional[str]:
     """
     Given a path to location of the RMS logs and, optionally a date in YYYYMMDD
     format, return the corresponding frames files directory.  Return None if
     the directory cannot be determined.
     """
-    
-    data_dir = os.path.join(log_dir, '..', 'FramesFiles')
-    data_dir = os.path.abspath(data_dir)
-    
-    parent_path = data_dir
+
+    parent_path = _sibling_abspath(log_dir, 'FramesFiles')
     latest_entry = None
     for depth in range(3):
-        entries = glob.glob(os.path.join(parent_path, '*'))
         if date:
-            if depth == 0:
-                entries = list(filter(lambda x: x.find(date[:4]) != -1, entries))
-            else:
-                entries = list(filter(lambda x: x.find(date) != -1, entries))
-            
-        latest_mtime = 0
-        for entry in entries:
-            if not os.path.isdir(entry):
-                continue
-                
-            mtime = os.path.getmtime(entry)
-            if mtime > latest_mtime:
-                latest_entry = entry
-                latest_mtime = mtime
-                
-        parent_path = os.path.join(parent_path, os.path.basename(latest_entry))
-            
-    return latest_entry
+            # The tree is laid out as <YYYY>/<YYYYMM>/<date...>, so each
+            # level has exactly one directory of interest and the scan can
+            # stop as soon as it is found
+            entry = _dated_subdir(parent_path, date, depth)
+        else:
+            entry = _latest_subdir(parent_path)
+        if entry is None:
+            break
 
+        latest_entry = entry
+        parent_path = entry
 
-def timed_lru_cache(seconds: int=600, maxsize: int=8):
-    """
-    Sub-class for `functools.lru_cache` that includes a lifetime for cached
-    calls.  Useful for caching results for web services.
-    """
-    
-    def decorator(func):
-        func = lru_cache(maxsize=maxsize)(func)
-        func.lifetime = seconds
-        func.expiration = time.time() + func.lifetime
-
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Check if cache has expired
-            if time.time() >= func.expiration:
-                func.cache_clear()
-                func.expiration = time.time() + func.lifetime
-            return func(*args, **kwargs)
-
-        return wrapper
-    return decorator
+    return latest_entry
@@ -7,8 +7,8 @@ import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
-import glob
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from RMS.Logger import getLogger
 
@@ -17,23 +17,64 @@ from RMS_telemetry.images import fits_to_image, fits_to_movie
 
 log = getLogger("logger")
 
+def _warm_worker():
+    """
+    Pool initializer - pull in the heavy astropy/matplotlib stack (and pin the
+    Agg backend) once per worker at startup so the first conversion isn't
+    slower than the rest.
+    """
+
+    import RMS_telemetry.images  # noqa: F401
+
+def _convert_one(fitsname):
+    """
+    Worker for rmsExternal - convert a single FITS file to a png and return
+    the filename, how long the conversion took, and whether it worked so that
+    the parent process can do the logging.
+    """
+
+    t0 = time.time()
+    success = fits_to_image(fitsname)
+    t1 = time.time()
+    return fitsname, t1-t0, success is not None
+
+def _needs_convert(entry):
+    """
+    Helper for rmsExternal - return True if the png for a FITS directory entry
+    is missing or older than the FITS file itself.
+    """
+
+    pngname = entry.path.replace('.fits', '.png')
+    try:
+        png_mtime = os.stat(pngname).st_mtime
+    except OSError:
+        return True
+    return png_mtime < entry.stat().st_mtime
+
 def rmsExternal(captured_night_dir, archived_night_dir, config):
-    fits_list = glob.glob(os.path.join(archived_night_dir, 'FF_*.fits'))
-    for fitsname in fits_list:
-        t0 = time.time()
-        success = fits_to_image(fitsname)
-        t1 = time.time()
-        
-        if success is not None:
-            log.debug(f"Converted {os.path.basename(fitsname)} to png in {t1-t0:.1f} s")
-        else:
-            log.warning(f"Failed to convert {os.path.basename(fitsname)} to png")
-            
-        # t0 = time.time()
-        # success = fits_to_movie(fitsname)
-        # t1 = time.time()
-        # 
-        # if success is not None:
-        #     log.debug(f"Converted {os.path.basename(fitsname)} to mp4 in {t1-t0:.1f} s")
-        # else:
-        #     log.warning(f"Failed to convert {os.path.basename(fitsname)} to mp4")
+    # List the directory with os.scandir so the freshness check below can
+    # reuse the stat information that comes with each entry
+    with os.scandir(archived_night_dir) as entries:
+        fits_list = [entry for entry in entries \
+                     if entry.is_file() \
+                        and entry.name.startswith('FF_') \
+                        and entry.name.endswith('.fits')]
+    fits_list.sort(key=lambda entry: entry.name)
+
+    # Only convert files whose png is missing or stale - on a re-run most of
+    # the directory has already been converted and can be skipped outright
+    fits_list = [entry.path for entry in fits_list if _needs_convert(entry)]
+
+    # The conversions are CPU-bound and independent of each other, so spread
+    # them across the cores with a process pool instead of walking the list
+    # serially
+    with ProcessPoolExecutor(max_workers=os.cpu_count() or 2,
+                             initializer=_warm_worker) as pool:
+        futures = [pool.submit(_convert_one, fitsname) for fitsname in fits_list]
+        for future in as_completed(futures):
+            fitsname, elapsed, success = future.result()
+
+            if success:
+                log.debug(f"Converted {os.path.basename(fitsname)} to png in {elapsed:.1f} s")
+            else:
+                log.warning(f"Failed to convert {os.path.basename(fitsname)} to png")